@@ -3,17 +3,208 @@ from src.agents.state import AgentState, show_agent_reasoning, show_workflow_sta
 from src.tools.openrouter_config import get_chat_completion
 from src.utils.api_utils import agent_endpoint, log_llm_interaction
 from src.utils.logging_config import setup_logger
-from src.agents.regime_detector import AdvancedRegimeDetector, adaptive_signal_aggregation
+from src.utils.lru_cache import LRUCache
+from src.agents.regime_detector import AdvancedRegimeDetector, adaptive_signal_aggregation, SIGNAL_VALUE_MAPPING
 from src.tools.api import prices_to_df
 import json
 import ast
+import hashlib
+import numpy as np
 import pandas as pd
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # 获取日志记录器
 logger = setup_logger('debate_room')
 
 
+def _json_loads(content):
+    """解析JSON，优先使用orjson
+
+    其他agent用json.dumps输出消息，可能包含orjson不支持的NaN/Infinity，此时回退到标准库
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _numpy_json_default(obj):
+    """json.dumps的default钩子：将numpy数组和标量转换为Python对象"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite(obj) -> bool:
+    """检查对象中是否含有NaN/Infinity浮点数（递归检查dict/list/tuple与numpy数组）"""
+    if isinstance(obj, (float, np.floating)):
+        return not np.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(key) or _has_non_finite(value) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind == 'f' and not np.isfinite(obj).all()
+    return False
+
+
+def _json_dumps(obj) -> str:
+    """序列化为JSON字符串，优先使用orjson
+
+    orjson会把NaN/Infinity写成null，对象中含有非有限浮点数时改用json.dumps，保持NaN/Infinity原样输出
+    """
+    if HAS_ORJSON and not _has_non_finite(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj, default=_numpy_json_default)
+
+
+def _looks_like_python_literal(content) -> bool:
+    """粗略判断内容是否为Python字面量（如dict的repr），只有这类内容才值得交给ast.literal_eval"""
+    return isinstance(content, str) and content.lstrip()[:1] in ('{', '[', '(')
+
+
+# 映射agent名称到信号类型
+_AGENT_TYPE_MAPPING = {
+    'technical_analyst_agent': 'technical',
+    'fundamentals_agent': 'fundamental',
+    'sentiment_agent': 'sentiment',
+    'valuation_agent': 'valuation',
+    'ai_model_analyst_agent': 'ai_model',
+    'macro_analyst_agent': 'macro'
+}
+
+# 数值信号转字符串信号：> 0.1 为bullish，< -0.1 为bearish，±0.1本身归为neutral
+_SIGNAL_THRESHOLDS = np.array([-0.1, np.nextafter(0.1, np.inf)])
+_SIGNAL_LABELS = np.array(['bearish', 'neutral', 'bullish'])
+
+# 区制检测结果缓存：同一价格窗口在同一bar内会被多次分析，避免重复拟合GMM
+_REGIME_CACHE_COLUMNS = ['close', 'open', 'high', 'low', 'volume']
+_regime_cache = LRUCache(maxsize=128)
+
+# LLM增强分析缓存：区制与信号快照（置信度量化到0.1）相同时复用此前的LLM结果
+_llm_analysis_cache = LRUCache(maxsize=512)
+
+
+def _signal_to_label(numeric_signal):
+    """通过阈值查表将数值信号映射为字符串信号（NaN视为neutral），支持标量和数组输入"""
+    idx = np.searchsorted(_SIGNAL_THRESHOLDS, np.nan_to_num(numeric_signal, nan=0.0), side='right')
+    labels = _SIGNAL_LABELS[idx]
+    return str(labels) if np.ndim(labels) == 0 else labels
+
+
+def _to_float_confidence(conf_value) -> float:
+    """将置信度统一解析为[0, 1]区间的float，信号收集时调用一次，下游直接使用解析结果
+
+    支持0.7、"0.7"、"70%"以及70（大于1的数值视为百分数）等格式，无法解析时返回0.5
+    """
+    if isinstance(conf_value, str):
+        text = conf_value.strip()
+        try:
+            if text.endswith('%'):
+                return min(max(float(text[:-1]) / 100.0, 0.0), 1.0)
+            value = float(text)
+        except ValueError:
+            return 0.5
+    elif isinstance(conf_value, (int, float)):
+        value = float(conf_value)
+    else:
+        return 0.5
+    if value > 1.0:
+        value /= 100.0
+    return min(max(value, 0.0), 1.0)
+
+
+def _regime_cache_key(prices_df: pd.DataFrame, regime_detector: AdvancedRegimeDetector) -> tuple:
+    """根据价格数据内容和检测器配置生成缓存键"""
+    columns = [col for col in _REGIME_CACHE_COLUMNS if col in prices_df.columns]
+    row_hashes = pd.util.hash_pandas_object(prices_df[columns], index=True).to_numpy()
+    return (
+        hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest(),
+        len(prices_df),
+        tuple(columns),
+        regime_detector.n_regimes,
+        regime_detector.lookback_window,
+    )
+
+
+def _detect_regime(prices_df: pd.DataFrame, regime_detector: AdvancedRegimeDetector) -> tuple:
+    """提取区制特征、拟合模型并预测当前区制，结果按价格窗口哈希缓存
+
+    Returns:
+        (regime_model_results, current_regime)
+    """
+    try:
+        key = _regime_cache_key(prices_df, regime_detector)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"无法生成区制缓存键，跳过缓存: {e}")
+        key = None
+
+    cached = _regime_cache.get(key) if key is not None else None
+    if cached is not None:
+        logger.debug("命中区制检测缓存")
+        return dict(cached[0]), dict(cached[1])
+
+    regime_features = regime_detector.extract_regime_features(prices_df)
+    regime_model_results = regime_detector.fit_regime_model(regime_features)
+    current_regime = regime_detector.predict_current_regime(regime_features)
+
+    if key is not None:
+        _regime_cache.put(key, (regime_model_results, current_regime))
+
+    return dict(regime_model_results), dict(current_regime)
+
+
+def _parse_agent_message(msg):
+    """解析单条agent消息
+
+    Returns:
+        (msg, signal_type, signal_entry)；不是可映射的信号agent时signal_type为None，
+        消息内容无法解析时返回None
+    """
+    try:
+        if not hasattr(msg, 'content') or msg.content is None:
+            return None
+        content = _json_loads(msg.content) if isinstance(msg.content, str) else msg.content
+        
+        signal_type = _AGENT_TYPE_MAPPING.get(msg.name)
+        if signal_type is None:
+            return msg, None, None
+        
+        # 确保信号值的正确处理
+        return msg, signal_type, {
+            'signal': content.get('signal', 'neutral'),
+            'confidence': _to_float_confidence(content.get('confidence', 0.5)),
+            'raw_data': content
+        }
+    except (json.JSONDecodeError, TypeError, AttributeError) as e:
+        logger.warning(f"无法解析 {msg.name} 的消息内容: {e}")
+        return None
+
+
+def _parse_agent_messages(messages) -> list:
+    """按消息顺序解析所有agent消息，跳过无法解析的消息"""
+    # 添加防御性检查，确保 msg 和 msg.name 不为 None
+    candidates = [
+        msg for msg in messages
+        if msg is not None and getattr(msg, 'name', None) is not None and msg.name.endswith("_agent")
+    ]
+    parsed = (_parse_agent_message(msg) for msg in candidates)
+    return [item for item in parsed if item is not None]
+
+
 @agent_endpoint("debate_room", "辩论室，分析多空双方观点，得出平衡的投资结论")
 def debate_room_agent(state: AgentState):
     """
@@ -33,10 +224,8 @@ def debate_room_agent(state: AgentState):
         prices = data["prices"]
         prices_df = prices_to_df(prices)
         
-        # 提取区制特征并进行分析
-        regime_features = regime_detector.extract_regime_features(prices_df)
-        regime_model_results = regime_detector.fit_regime_model(regime_features)
-        current_regime = regime_detector.predict_current_regime(regime_features)
+        # 提取区制特征并进行分析（相同价格窗口复用缓存结果）
+        regime_model_results, current_regime = _detect_regime(prices_df, regime_detector)
         
         logger.info(f"检测到市场区制: {current_regime.get('regime_name', 'unknown')} (置信度: {current_regime.get('confidence', 0):.2f})")
 
@@ -44,50 +233,39 @@ def debate_room_agent(state: AgentState):
         agent_signals = {}
         researcher_messages = {}
         
-        for msg in state["messages"]:
-            # 添加防御性检查，确保 msg 和 msg.name 不为 None
-            if msg is None:
-                continue
-            if not hasattr(msg, 'name') or msg.name is None:
+        for msg, signal_type, signal_entry in _parse_agent_messages(state["messages"]):
+            if signal_type is not None:
+                agent_signals[signal_type] = signal_entry
+                logger.debug(f"收集到{signal_type}信号: {signal_entry['signal']} (置信度: {signal_entry['confidence']})")
+            
+            # 同时保持原有的研究员逻辑
+            if msg.name.startswith("researcher_"):
+                researcher_messages[msg.name] = msg
+                logger.debug(f"收集到研究员信息: {msg.name}")
+
+        # 解析研究员数据（只解析一次，传统辩论逻辑和LLM分析共用）
+        researcher_data = {}
+        for name, msg in researcher_messages.items():
+            if not hasattr(msg, 'content') or msg.content is None:
+                logger.warning(f"研究员 {name} 的消息内容为空")
                 continue
-                
-            # 收集各类agent信号
-            if msg.name.endswith("_agent"):
+            try:
+                data_content = _json_loads(msg.content)
+                logger.debug(f"成功解析 {name} 的 JSON 内容")
+            except (json.JSONDecodeError, TypeError):
+                if not _looks_like_python_literal(msg.content):
+                    logger.warning(f"无法解析 {name} 的消息内容，已跳过")
+                    continue
                 try:
-                    if hasattr(msg, 'content') and msg.content is not None:
-                        content = json.loads(msg.content) if isinstance(msg.content, str) else msg.content
-                        
-                        # 映射agent名称到信号类型
-                        agent_type_mapping = {
-                            'technical_analyst_agent': 'technical',
-                            'fundamentals_agent': 'fundamental', 
-                            'sentiment_agent': 'sentiment',
-                            'valuation_agent': 'valuation',
-                            'ai_model_analyst_agent': 'ai_model',
-                            'macro_analyst_agent': 'macro'
-                        }
-                        
-                        if msg.name in agent_type_mapping:
-                            signal_type = agent_type_mapping[msg.name]
-                            # 确保信号值的正确处理
-                            raw_signal = content.get('signal', 'neutral')
-                            confidence = content.get('confidence', 0.5)
-                            
-                            agent_signals[signal_type] = {
-                                'signal': raw_signal,
-                                'confidence': confidence,
-                                'raw_data': content
-                            }
-                            logger.debug(f"收集到{signal_type}信号: {raw_signal} (置信度: {confidence})")
-                        
-                        # 同时保持原有的研究员逻辑
-                        if msg.name.startswith("researcher_"):
-                            researcher_messages[msg.name] = msg
-                            logger.debug(f"收集到研究员信息: {msg.name}")
-                            
-                except (json.JSONDecodeError, TypeError, AttributeError) as e:
-                    logger.warning(f"无法解析 {msg.name} 的消息内容: {e}")
+                    data_content = ast.literal_eval(msg.content)
+                    logger.debug(f"通过 ast.literal_eval 解析 {name} 的内容")
+                except (ValueError, SyntaxError, TypeError):
+                    logger.warning(f"无法解析 {name} 的消息内容，已跳过")
                     continue
+            if isinstance(data_content, dict) and 'confidence' in data_content:
+                # 置信度在收集时统一解析，下游直接使用float
+                data_content['confidence'] = _to_float_confidence(data_content['confidence'])
+            researcher_data[name] = data_content
 
         # 使用新的自适应信号聚合系统
         if agent_signals and current_regime.get('regime_name') != 'unknown':
@@ -130,7 +308,7 @@ def debate_room_agent(state: AgentState):
         else:
             # 回退到原有逻辑（保持向后兼容）
             logger.info("使用传统辩论逻辑（信号不足或区制检测失败）")
-            enhanced_analysis = _traditional_debate_logic(state, researcher_messages, logger)
+            enhanced_analysis = _traditional_debate_logic(state, researcher_messages, researcher_data, logger)
 
         # 确保至少有看多和看空两个研究员（保持原有验证逻辑）
         if "researcher_bull_agent" not in researcher_messages or "researcher_bear_agent" not in researcher_messages:
@@ -139,24 +317,6 @@ def debate_room_agent(state: AgentState):
             if not agent_signals:
                 raise ValueError("Missing required researcher_bull_agent or researcher_bear_agent messages")
 
-        # 处理研究员数据（保持原有逻辑用于LLM分析）
-        researcher_data = {}
-        for name, msg in researcher_messages.items():
-            if not hasattr(msg, 'content') or msg.content is None:
-                logger.warning(f"研究员 {name} 的消息内容为空")
-                continue
-            try:
-                data_content = json.loads(msg.content)
-                logger.debug(f"成功解析 {name} 的 JSON 内容")
-            except (json.JSONDecodeError, TypeError):
-                try:
-                    data_content = ast.literal_eval(msg.content)
-                    logger.debug(f"通过 ast.literal_eval 解析 {name} 的内容")
-                except (ValueError, SyntaxError, TypeError):
-                    logger.warning(f"无法解析 {name} 的消息内容，已跳过")
-                    continue
-            researcher_data[name] = data_content
-
         # 如果有研究员数据，进行LLM增强分析
         if len(researcher_data) >= 2:
             llm_enhanced_analysis = _get_llm_enhanced_analysis(
@@ -174,8 +334,7 @@ def debate_room_agent(state: AgentState):
                 current_signal = enhanced_analysis['signal']
                 if isinstance(current_signal, str):
                     # 将字符串信号转换为数值
-                    signal_mapping = {'bullish': 1.0, 'neutral': 0.0, 'bearish': -1.0}
-                    numeric_signal = signal_mapping.get(current_signal.lower(), 0.0)
+                    numeric_signal = SIGNAL_VALUE_MAPPING.get(current_signal.lower(), 0.0)
                 else:
                     numeric_signal = float(current_signal)
                 
@@ -198,7 +357,7 @@ def debate_room_agent(state: AgentState):
 
         # 创建最终消息
         message = HumanMessage(
-            content=json.dumps(enhanced_analysis),
+            content=_json_dumps(enhanced_analysis),
             name="debate_room_agent",
         )
 
@@ -224,7 +383,7 @@ def debate_room_agent(state: AgentState):
         }
         
         message = HumanMessage(
-            content=json.dumps(default_analysis),
+            content=_json_dumps(default_analysis),
             name="debate_room_agent",
         )
         
@@ -235,8 +394,8 @@ def debate_room_agent(state: AgentState):
         }
 
 
-def _traditional_debate_logic(state: AgentState, researcher_messages: dict, logger) -> dict:
-    """传统辩论逻辑的异步版本"""
+def _traditional_debate_logic(state: AgentState, researcher_messages: dict, researcher_data: dict, logger) -> dict:
+    """传统辩论逻辑的异步版本，researcher_data为已解析的研究员数据（置信度已解析为float）"""
     # 这里实现原有的简单平均逻辑作为回退
     if len(researcher_messages) < 2:
         return {
@@ -245,74 +404,37 @@ def _traditional_debate_logic(state: AgentState, researcher_messages: dict, logg
             "aggregation_method": "insufficient_data"
         }
     
-    def _parse_confidence(conf_value):
-        """解析置信度值，支持字符串和数值格式"""
-        if isinstance(conf_value, str):
-            if conf_value.endswith('%'):
-                try:
-                    return float(conf_value[:-1]) / 100.0
-                except ValueError:
-                    return 0.5
-            try:
-                return float(conf_value)
-            except ValueError:
-                return 0.5
-        elif isinstance(conf_value, (int, float)):
-            if conf_value > 1.0:
-                return conf_value / 100.0
-            return float(conf_value)
-        else:
-            return 0.5
-    
-    # 转换研究员观点为数值信号
-    perspective_values = {
-        'bullish': 1.0,
-        'neutral': 0.0,
-        'bearish': -1.0
-    }
+    # 收集研究员的数值信号与置信度
+    numeric_signals = []
+    confidences = []
     
-    # 简单平均研究员信号
-    total_signal = 0
-    total_confidence = 0
-    count = 0
-    
-    for name, msg in researcher_messages.items():
+    for name, data in researcher_data.items():
         try:
-            data = json.loads(msg.content)
             # 研究员使用 perspective 而不是 signal
             perspective = data.get('perspective', 'neutral')
-            raw_confidence = data.get('confidence', 0.5)
-            
-            # 解析置信度
-            confidence = _parse_confidence(raw_confidence)
+            confidence = data.get('confidence', 0.5)
             
             # 转换观点为数值
-            numeric_signal = perspective_values.get(perspective, 0.0)
-            
-            total_signal += numeric_signal * confidence
-            total_confidence += confidence
-            count += 1
+            numeric_signal = SIGNAL_VALUE_MAPPING.get(perspective, 0.0)
         except Exception as e:
             logger.warning(f"解析研究员 {name} 数据时出错: {e}")
             continue
+        numeric_signals.append(numeric_signal)
+        confidences.append(confidence)
     
-    if count > 0:
+    # 置信度加权平均研究员信号
+    if confidences:
+        confidence_arr = np.asarray(confidences, dtype=np.float64)
+        total_signal = float(np.asarray(numeric_signals, dtype=np.float64) @ confidence_arr)
+        total_confidence = float(confidence_arr.sum())
         avg_signal = total_signal / total_confidence if total_confidence > 0 else 0
-        avg_confidence = total_confidence / count if count > 0 else 0.3
+        avg_confidence = total_confidence / len(confidences)
     else:
         avg_signal = 0
         avg_confidence = 0.3
     
-    # 转换数值信号为字符串信号
-    if avg_signal > 0.1:  # 从0.2降低到0.1
-        signal_str = "bullish"
-    elif avg_signal < -0.1:  # 从-0.2降低到-0.1
-        signal_str = "bearish"
-    else:
-        signal_str = "neutral"
-    
     return {
-        "signal": signal_str,
+        "signal": _signal_to_label(avg_signal),
         "confidence": avg_confidence,
         "aggregation_method": "traditional_average"
     }
@@ -321,50 +443,56 @@ def _traditional_debate_logic(state: AgentState, researcher_messages: dict, logg
 def _get_llm_enhanced_analysis(researcher_data: dict, agent_signals: dict, current_regime: dict, state: AgentState, logger) -> dict:
     """获取LLM增强分析"""
     
-    def _parse_confidence_for_display(conf_value):
-        """解析置信度值用于显示"""
-        if isinstance(conf_value, str):
-            if conf_value.endswith('%'):
-                try:
-                    return float(conf_value[:-1]) / 100.0
-                except ValueError:
-                    return 0.5
-            try:
-                return float(conf_value)
-            except ValueError:
-                return 0.5
-        elif isinstance(conf_value, (int, float)):
-            if conf_value > 1.0:
-                return conf_value / 100.0
-            return float(conf_value)
-        else:
-            return 0.5
-    
     # 构建发送给 LLM 的提示（保持原有逻辑但增强）
-    regime_confidence = _parse_confidence_for_display(current_regime.get('confidence', 0))
+    regime_confidence = _to_float_confidence(current_regime.get('confidence', 0))
+
+    # 以区制、量化后的信号快照和研究员论点生成缓存键，命中时跳过LLM调用
+    try:
+        researcher_digest = hashlib.blake2b(
+            json.dumps(researcher_data, sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).digest()
+        cache_key = (
+            current_regime.get('regime_name', 'unknown'),
+            round(regime_confidence, 1),
+            tuple(sorted(
+                (signal_type,
+                 str(signal_data.get('signal', 'neutral')),
+                 round(signal_data.get('confidence', 0), 1))
+                for signal_type, signal_data in agent_signals.items()
+            )),
+            researcher_digest,
+        )
+    except (TypeError, ValueError) as e:
+        logger.debug(f"无法生成LLM分析缓存键，跳过缓存: {e}")
+        cache_key = None
+
+    cached_analysis = _llm_analysis_cache.get(cache_key) if cache_key is not None else None
+    if cached_analysis is not None:
+        logger.info(f"命中LLM增强分析缓存，评分: {cached_analysis['llm_score']}")
+        return dict(cached_analysis)
     
-    llm_prompt = f"""
+    # 逐段收集提示内容，最后一次性拼接
+    prompt_parts = [f"""
 You are a professional financial analyst. Analyze the following investment research and provide your third-party analysis.
 
 Current Market Regime: {current_regime.get('regime_name', 'unknown')} (Confidence: {regime_confidence:.2f})
 
 RESEARCH PERSPECTIVES:
-"""
+"""]
     
     # 添加研究员观点
     for name, data in researcher_data.items():
         perspective = name.replace("researcher_", "").replace("_agent", "").upper()
-        researcher_confidence = _parse_confidence_for_display(data.get('confidence', 0))
-        llm_prompt += f"\n{perspective} VIEW (Confidence: {researcher_confidence:.2f}):\n"
+        prompt_parts.append(f"\n{perspective} VIEW (Confidence: {data.get('confidence', 0):.2f}):\n")
         for point in data.get("thesis_points", []):
-            llm_prompt += f"- {point}\n"
+            prompt_parts.append(f"- {point}\n")
     
     # 添加量化信号摘要
     if agent_signals:
-        llm_prompt += f"\nQUANTITATIVE SIGNALS:\n"
+        prompt_parts.append("\nQUANTITATIVE SIGNALS:\n")
         for signal_type, signal_data in agent_signals.items():
             signal_value = signal_data.get('signal', 'neutral')
-            confidence_value = signal_data.get('confidence', 0)
             
             # 处理信号值显示
             if isinstance(signal_value, str):
@@ -372,11 +500,10 @@ RESEARCH PERSPECTIVES:
             else:
                 signal_display = f"{signal_value:.2f}"
             
-            # 处理置信度显示
-            parsed_confidence = _parse_confidence_for_display(confidence_value)
-            llm_prompt += f"- {signal_type.title()}: {signal_display} (Confidence: {parsed_confidence:.2f})\n"
+            # 置信度已在收集信号时解析为float
+            prompt_parts.append(f"- {signal_type.title()}: {signal_display} (Confidence: {signal_data.get('confidence', 0):.2f})\n")
     
-    llm_prompt += f"""
+    prompt_parts.append(f"""
 MARKET REGIME CONTEXT:
 - Detected regime: {current_regime.get('regime_name', 'unknown')}
 - Regime confidence: {regime_confidence:.2f}
@@ -391,7 +518,8 @@ Please provide your analysis in the following JSON format:
 }}
 
 Ensure your response is valid JSON format and includes all fields above. Respond in English only.
-"""
+""")
+    llm_prompt = "".join(prompt_parts)
 
     try:
         logger.info("开始调用 LLM 获取增强分析...")
@@ -410,16 +538,19 @@ Ensure your response is valid JSON format and includes all fields above. Respond
             json_end = llm_response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = llm_response[json_start:json_end]
-                llm_analysis = json.loads(json_str)
+                llm_analysis = _json_loads(json_str)
                 llm_score = float(llm_analysis.get("score", 0))
                 llm_score = max(min(llm_score, 1.0), -1.0)  # 确保在有效范围内
                 
                 logger.info(f"LLM增强分析完成，评分: {llm_score}")
-                return {
+                result = {
                     "llm_score": llm_score,
                     "llm_analysis": llm_analysis,
                     "llm_response": llm_response
                 }
+                if cache_key is not None:
+                    _llm_analysis_cache.put(cache_key, result)
+                return dict(result)
     except Exception as e:
         logger.error(f"LLM增强分析失败: {e}")
     
@@ -432,13 +563,8 @@ def _convert_numeric_signal_to_string(analysis: dict) -> dict:
         numeric_signal = analysis["signal"]
         original_signal = numeric_signal
         
-        # 降低转换阈值使系统对较小信号更敏感
-        if numeric_signal > 0.1:  # 从0.2降低到0.1
-            analysis["signal"] = "bullish"
-        elif numeric_signal < -0.1:  # 从-0.2降低到-0.1
-            analysis["signal"] = "bearish"
-        else:
-            analysis["signal"] = "neutral"
+        # 降低转换阈值使系统对较小信号更敏感（阈值从±0.2降低到±0.1）
+        analysis["signal"] = _signal_to_label(numeric_signal)
         
         # 添加转换日志用于调试
         logger = logging.getLogger(__name__)
@@ -415,6 +415,48 @@ class AdvancedRegimeDetector:
                 "note": simplified_result.get("note", "Fallback to simplified detection")
             }
 
+
+# 字符串信号到数值信号的映射（debate_room共用此表，只读，勿在运行时修改）
+SIGNAL_VALUE_MAPPING = {
+    'bullish': 1.0,
+    'neutral': 0.0,
+    'bearish': -1.0
+}
+
+# 基础权重 (来自FINSABER 2024研究)
+_BASE_SIGNAL_WEIGHTS = {
+    'technical': 0.25,
+    'fundamental': 0.20,
+    'sentiment': 0.15,
+    'valuation': 0.15,
+    'ai_model': 0.15,
+    'macro': 0.10
+}
+
+# 区制特定权重调整 (基于Lopez-Lira 2025框架)
+_REGIME_WEIGHT_ADJUSTMENTS = {
+    "low_volatility_trending": {
+        'technical': 1.3,  # 增强技术分析权重
+        'ai_model': 1.2,   # AI模型在趋势市场表现更好
+        'sentiment': 0.8,  # 降低情绪权重
+        'fundamental': 0.9
+    },
+    "high_volatility_mean_reverting": {
+        'fundamental': 1.4,  # 基本面在震荡市场更重要
+        'valuation': 1.3,    # 估值回归
+        'technical': 0.8,    # 降低技术分析权重
+        'sentiment': 0.7     # 情绪噪音较大
+    },
+    "crisis_regime": {
+        'macro': 1.5,       # 宏观因素主导
+        'sentiment': 1.2,   # 恐慌情绪重要
+        'ai_model': 0.7,    # AI模型在危机中表现较差
+        'technical': 0.8,
+        'fundamental': 0.9
+    }
+}
+
+
 def adaptive_signal_aggregation(signals: Dict, regime_info: Dict, confidence_threshold: float = 0.6) -> Dict:
     """
     基于FLAG-Trader 2025研究的自适应信号聚合
@@ -423,50 +465,10 @@ def adaptive_signal_aggregation(signals: Dict, regime_info: Dict, confidence_thr
     regime_name = regime_info.get("regime_name", "unknown")
     regime_confidence = regime_info.get("confidence", 0.5)
     
-    # 信号值映射
-    signal_value_mapping = {
-        'bullish': 1.0,
-        'neutral': 0.0,
-        'bearish': -1.0
-    }
-    
-    # 基础权重 (来自FINSABER 2024研究)
-    base_weights = {
-        'technical': 0.25,
-        'fundamental': 0.20,
-        'sentiment': 0.15,
-        'valuation': 0.15,
-        'ai_model': 0.15,
-        'macro': 0.10
-    }
-    
-    # 区制特定权重调整 (基于Lopez-Lira 2025框架)
-    regime_adjustments = {
-        "low_volatility_trending": {
-            'technical': 1.3,  # 增强技术分析权重
-            'ai_model': 1.2,   # AI模型在趋势市场表现更好
-            'sentiment': 0.8,  # 降低情绪权重
-            'fundamental': 0.9
-        },
-        "high_volatility_mean_reverting": {
-            'fundamental': 1.4,  # 基本面在震荡市场更重要
-            'valuation': 1.3,    # 估值回归
-            'technical': 0.8,    # 降低技术分析权重
-            'sentiment': 0.7     # 情绪噪音较大
-        },
-        "crisis_regime": {
-            'macro': 1.5,       # 宏观因素主导
-            'sentiment': 1.2,   # 恐慌情绪重要
-            'ai_model': 0.7,    # AI模型在危机中表现较差
-            'technical': 0.8,
-            'fundamental': 0.9
-        }
-    }
-    
     # 应用区制调整
-    adjusted_weights = base_weights.copy()
-    if regime_name in regime_adjustments and regime_confidence > confidence_threshold:
-        adjustments = regime_adjustments[regime_name]
+    adjusted_weights = _BASE_SIGNAL_WEIGHTS.copy()
+    if regime_name in _REGIME_WEIGHT_ADJUSTMENTS and regime_confidence > confidence_threshold:
+        adjustments = _REGIME_WEIGHT_ADJUSTMENTS[regime_name]
         for signal_type in adjusted_weights:
             if signal_type in adjustments:
                 adjusted_weights[signal_type] *= adjustments[signal_type]
@@ -480,43 +482,20 @@ def adaptive_signal_aggregation(signals: Dict, regime_info: Dict, confidence_thr
     weighted_confidence = 0
     signal_contributions = {}
     
-    def _parse_confidence(conf_value):
-        """解析置信度值，支持字符串和数值格式"""
-        if isinstance(conf_value, str):
-            # 处理百分比格式 (如 "50%")
-            if conf_value.endswith('%'):
-                try:
-                    return float(conf_value[:-1]) / 100.0
-                except ValueError:
-                    return 0.5
-            # 处理纯数字字符串
-            try:
-                return float(conf_value)
-            except ValueError:
-                return 0.5
-        elif isinstance(conf_value, (int, float)):
-            # 如果是数值，确保在0-1范围内
-            if conf_value > 1.0:
-                return conf_value / 100.0  # 假设是百分比形式
-            return float(conf_value)
-        else:
-            return 0.5  # 默认置信度
-    
     for signal_type, weight in adjusted_weights.items():
         if signal_type in signals:
             signal_data = signals[signal_type]
             raw_signal = signal_data.get('signal', 'neutral')
-            raw_confidence = signal_data.get('confidence', 0.5)
-            
-            # 解析置信度
-            signal_conf = _parse_confidence(raw_confidence)
+            # 置信度已在收集信号时解析为[0, 1]区间的float，原始值保留在raw_data中
+            signal_conf = signal_data.get('confidence', 0.5)
+            raw_confidence = signal_data.get('raw_data', {}).get('confidence', signal_conf)
             
             # 应用最小置信度下限，避免过低的置信度完全抵消信号
             signal_conf = max(signal_conf, 0.2)  # 最低置信度为0.2
             
             # 转换字符串信号为数值
             if isinstance(raw_signal, str):
-                signal_value = signal_value_mapping.get(raw_signal.lower(), 0.0)
+                signal_value = SIGNAL_VALUE_MAPPING.get(raw_signal.lower(), 0.0)
             else:
                 # 如果已经是数值，直接使用
                 signal_value = float(raw_signal)
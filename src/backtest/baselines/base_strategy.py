@@ -1,16 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Signal:
-    """交易信号类"""
+    """交易信号类（不可变，使用__slots__减少逐bar构造的内存与属性访问开销）"""
     action: str  # 'buy', 'sell', 'hold'
     quantity: int
     confidence: float
     reasoning: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    # 元数据延迟构建函数，仅在调用get_metadata()时执行
+    metadata_factory: Optional[Callable[[], Dict[str, Any]]] = field(default=None, repr=False, compare=False)
+    
+    def get_metadata(self) -> Dict[str, Any]:
+        """获取信号元数据，未直接提供metadata时通过metadata_factory按需构建（不写回实例）"""
+        if self.metadata is not None:
+            return self.metadata
+        if self.metadata_factory is not None:
+            return self.metadata_factory()
+        return {}
 
 @dataclass 
 class Portfolio:
@@ -25,6 +35,9 @@ class BaseStrategy(ABC):
     所有baseline策略都应该继承此类
     """
     
+    # 是否需要在回测开始前通过prepare()获取完整历史数据进行预计算
+    requires_full_history = False
+    
     def __init__(self, name: str, **kwargs):
         self.name = name
         self.parameters = kwargs
@@ -48,6 +61,16 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def prepare(self, data: pd.DataFrame):
+        """
+        回测开始前传入完整历史数据，供策略一次性预计算指标
+        仅当requires_full_history为True时由回测引擎调用，默认不做任何处理
+        
+        Args:
+            data: 覆盖整个回测区间（含回看期）的价格数据
+        """
+        pass
+    
     def initialize(self, initial_capital: float):
         """初始化策略"""
         self.initial_capital = initial_capital
@@ -71,6 +94,8 @@ class BaseStrategy(ABC):
             self.signal_count = 0
         if hasattr(self, 'initial_purchase_made'):
             self.initial_purchase_made = False
+        if hasattr(self, '_precomputed'):
+            self._precomputed = None
         
     def record_signal(self, signal: Signal, date: str, price: float):
         """记录信号历史"""
@@ -13,6 +13,14 @@ class BuyHoldStrategy(BaseStrategy):
         super().__init__(name, **kwargs)
         self.allocation_ratio = allocation_ratio  # 资金配置比例
         self.initial_purchase_made = False
+        # Signal不可变，所有持有bar共享同一个对象
+        self._hold_signal = Signal(
+            action='hold',
+            quantity=0,
+            confidence=1.0,
+            reasoning="Buy-and-hold strategy maintains position",
+            metadata=None
+        )
         
     def generate_signal(self, data: pd.DataFrame, portfolio: Portfolio, 
                        current_date: str, **kwargs) -> Signal:
@@ -21,9 +29,12 @@ class BuyHoldStrategy(BaseStrategy):
         - 第一次交易时买入并持有
         - 之后所有时间都持有
         """
-        if not self.initial_purchase_made and portfolio.cash > 0:
+        if self.initial_purchase_made:
+            return self._hold_signal
+        
+        if portfolio.cash > 0:
             # 第一次投资：买入
-            current_price = data.iloc[-1]['close']
+            current_price = data['close'].iat[-1]
             max_shares = int((portfolio.cash * self.allocation_ratio) / current_price)
             
             if max_shares > 0:
@@ -36,10 +47,5 @@ class BuyHoldStrategy(BaseStrategy):
                     metadata={'allocation_ratio': self.allocation_ratio}
                 )
         
-        # 已投资或无法投资：持有
-        return Signal(
-            action='hold',
-            quantity=0,
-            confidence=1.0,
-            reasoning="Buy-and-hold strategy maintains position"
-        )
\ No newline at end of file
+        # 无法投资：持有
+        return self._hold_signal
\ No newline at end of file
@@ -1,12 +1,65 @@
+from functools import partial
+from typing import Optional
+
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from .base_strategy import BaseStrategy, Signal, Portfolio
 
+def _sliding_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """基于NumPy视图的滚动均值，前window-1个位置为NaN（与pandas rolling一致）"""
+    out = np.full(len(values), np.nan)
+    if 0 < window <= len(values):
+        out[window - 1:] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+def _tail_mean(prices: np.ndarray, window: int, offset: int = 0) -> float:
+    """最近window个价格（向前偏移offset个bar）的均值，含NaN时跳过NaN（与pandas mean一致）"""
+    end = len(prices) - offset
+    values = prices[end - window:end]
+    mean = values.mean()
+    if mean != mean:
+        mean = np.nanmean(values)
+    return mean
+
+
+def _compute_indicators(prices: np.ndarray, short_window: int, long_window: int) -> tuple:
+    """
+    一次性计算整段价格的均线与交叉信号
+    
+    Returns:
+        (short_ma, long_ma, golden_cross, death_cross)，均为与prices等长的数组；
+        第k位的交叉信号表示由第k-1位到第k位发生的均线交叉
+    """
+    short_ma = _sliding_mean(prices, short_window)
+    long_ma = _sliding_mean(prices, long_window)
+    golden_cross = np.zeros(len(prices), dtype=bool)
+    death_cross = np.zeros(len(prices), dtype=bool)
+    golden_cross[1:] = (short_ma[:-1] <= long_ma[:-1]) & (short_ma[1:] > long_ma[1:])
+    death_cross[1:] = (short_ma[:-1] >= long_ma[:-1]) & (short_ma[1:] < long_ma[1:])
+    return short_ma, long_ma, golden_cross, death_cross
+
+
+def _build_metadata(short_ma, long_ma, prev_short_ma, prev_long_ma, data_length) -> dict:
+    """构建均线信号的元数据字典"""
+    return {
+        'short_ma': short_ma,
+        'long_ma': long_ma,
+        'prev_short_ma': prev_short_ma,
+        'prev_long_ma': prev_long_ma,
+        'data_length': data_length
+    }
+
+
 class MovingAverageStrategy(BaseStrategy):
     """
     移动平均策略
     基于不同期间移动平均线交叉的技术分析策略
     """
     
+    requires_full_history = True
+    
     def __init__(self, short_window: int = 50, long_window: int = 200, 
                  signal_threshold: float = 0.005, **kwargs):
         # Extract name from kwargs if provided, otherwise use default
@@ -17,45 +70,89 @@ class MovingAverageStrategy(BaseStrategy):
         self.signal_threshold = signal_threshold
         self.last_signal = None
         self.signal_count = 0
+        # 回测开始前基于完整历史预计算的指标: (dates, prices, indicators)
+        self._precomputed = None
         
-    def generate_signal(self, data: pd.DataFrame, portfolio: Portfolio, 
-                       current_date: str, **kwargs) -> Signal:
+    def prepare(self, data: pd.DataFrame):
+        """基于完整历史一次性预计算均线与交叉信号，之后每个bar只需按日期查表"""
+        prices = data['close'].to_numpy(dtype=np.float64, copy=False)
+        if np.isnan(prices).any():
+            # 滚动均值无法跳过NaN，含缺失价格时逐bar计算
+            self._precomputed = None
+            return
+        # 回测数据使用RangeIndex，日期在date列中；没有date列时使用索引
+        dates = data['date'] if 'date' in data.columns else data.index
+        self._precomputed = (
+            pd.Index(dates),
+            prices,
+            _compute_indicators(prices, self.short_window, self.long_window)
+        )
+        
+    def _lookup_precomputed(self, data: pd.DataFrame, prices: np.ndarray) -> Optional[int]:
+        """在预计算结果中定位当前bar，无法安全复用时返回None"""
+        if self._precomputed is None or len(prices) < self.long_window + 1:
+            return None
+        dates, full_prices, _ = self._precomputed
+        current_date = data['date'].iat[-1] if 'date' in data.columns else data.index[-1]
+        try:
+            pos = dates.get_loc(current_date)
+        except (KeyError, TypeError):
+            return None
+        if not isinstance(pos, (int, np.integer)) or pos < self.long_window:
+            return None
+        # 校验计算均线所用的价格完全一致（不同查询区间的复权价格可能不同）
+        window = self.long_window + 1
+        if not np.array_equal(full_prices[pos - window + 1:pos + 1], prices[-window:], equal_nan=True):
+            return None
+        return int(pos)
+        
+    def _evaluate(self, data: pd.DataFrame, portfolio: Portfolio):
         """
-        移动平均策略逻辑：
-        - 短期均线上穿长期均线时买入
-        - 短期均线下穿长期均线时卖出
+        计算当前bar的交易决策
+        
+        Returns:
+            (action, quantity, confidence, details)，details为
+            (short_ma, long_ma, prev_short_ma, prev_long_ma, data_length)，数据不足时为None
         """
-        prices = data['close']
+        # 直接使用底层float64数组，避免逐次构造pandas Series
+        prices = data['close'].to_numpy(dtype=np.float64, copy=False)
         
         # 降低数据要求：只需要long_window天的数据
         if len(prices) < self.long_window:
-            return Signal(
-                action='hold',
-                quantity=0,
-                confidence=0.5,
-                reasoning=f"Insufficient data: need {self.long_window} periods, got {len(prices)}"
-            )
-        
-        # 计算当前移动平均线
-        short_ma = prices.tail(self.short_window).mean()
-        long_ma = prices.tail(self.long_window).mean()
+            return 'hold', 0, 0.5, None
         
-        # 计算前一期移动平均线（如果数据足够）
-        if len(prices) >= self.long_window + 1:
-            prev_short_ma = prices.iloc[-(self.short_window+1):-1].mean()
-            prev_long_ma = prices.iloc[-(self.long_window+1):-1].mean()
-            
-            # 使用交叉信号
-            golden_cross = (prev_short_ma <= prev_long_ma and short_ma > long_ma)
-            death_cross = (prev_short_ma >= prev_long_ma and short_ma < long_ma)
+        pos = self._lookup_precomputed(data, prices)
+        if pos is not None:
+            # 命中预计算结果，直接按位置取均线与交叉信号
+            short_ma_series, long_ma_series, golden_series, death_series = self._precomputed[2]
+            short_ma = short_ma_series[pos]
+            long_ma = long_ma_series[pos]
+            prev_short_ma = short_ma_series[pos - 1]
+            prev_long_ma = long_ma_series[pos - 1]
+            golden_cross = golden_series[pos]
+            death_cross = death_series[pos]
         else:
-            # 数据不足时，使用简单的位置关系
-            golden_cross = short_ma > long_ma * (1 + self.signal_threshold)
-            death_cross = short_ma < long_ma * (1 - self.signal_threshold)
-            prev_short_ma = short_ma
-            prev_long_ma = long_ma
+            # 计算当前移动平均线（只需对末尾切片求均值）
+            short_ma = _tail_mean(prices, self.short_window)
+            long_ma = _tail_mean(prices, self.long_window)
+            
+            # 计算前一期移动平均线（如果数据足够）
+            if len(prices) >= self.long_window + 1:
+                prev_short_ma = _tail_mean(prices, self.short_window, offset=1)
+                prev_long_ma = _tail_mean(prices, self.long_window, offset=1)
+                
+                # 使用交叉信号
+                golden_cross = (prev_short_ma <= prev_long_ma and short_ma > long_ma)
+                death_cross = (prev_short_ma >= prev_long_ma and short_ma < long_ma)
+            else:
+                # 数据不足时，使用简单的位置关系
+                golden_cross = short_ma > long_ma * (1 + self.signal_threshold)
+                death_cross = short_ma < long_ma * (1 - self.signal_threshold)
+                prev_short_ma = short_ma
+                prev_long_ma = long_ma
         
-        current_price = prices.iloc[-1]
+        details = (short_ma, long_ma, prev_short_ma, prev_long_ma, len(prices))
+        current_price = prices[-1]
         position_ratio = (portfolio.stock * current_price) / (portfolio.cash + portfolio.stock * current_price)
         
         # 黄金交叉 - 买入信号
@@ -65,19 +162,7 @@ class MovingAverageStrategy(BaseStrategy):
             quantity = int(max_investment / current_price)
             
             if quantity > 0:
-                return Signal(
-                    action='buy',
-                    quantity=quantity,
-                    confidence=0.7,
-                    reasoning=f"Golden cross: Short MA {short_ma:.2f} > Long MA {long_ma:.2f}",
-                    metadata={
-                        'short_ma': short_ma,
-                        'long_ma': long_ma,
-                        'prev_short_ma': prev_short_ma,
-                        'prev_long_ma': prev_long_ma,
-                        'data_length': len(prices)
-                    }
-                )
+                return 'buy', quantity, 0.7, details
         
         # 死亡交叉 - 卖出信号
         elif death_cross and portfolio.stock > 0:
@@ -85,31 +170,48 @@ class MovingAverageStrategy(BaseStrategy):
             quantity = int(portfolio.stock * 0.8)  # 卖出80%持仓
             
             if quantity > 0:
-                return Signal(
-                    action='sell',
-                    quantity=quantity,
-                    confidence=0.7,
-                    reasoning=f"Death cross: Short MA {short_ma:.2f} < Long MA {long_ma:.2f}",
-                    metadata={
-                        'short_ma': short_ma,
-                        'long_ma': long_ma,
-                        'prev_short_ma': prev_short_ma,
-                        'prev_long_ma': prev_long_ma,
-                        'data_length': len(prices)
-                    }
-                )
+                return 'sell', quantity, 0.7, details
         
         # 持有信号
+        return 'hold', 0, 0.5, details
+        
+    def generate_signal(self, data: pd.DataFrame, portfolio: Portfolio, 
+                       current_date: str, **kwargs) -> Signal:
+        """
+        移动平均策略逻辑：
+        - 短期均线上穿长期均线时买入
+        - 短期均线下穿长期均线时卖出
+        """
+        action, quantity, confidence, details = self._evaluate(data, portfolio)
+        
+        if details is None:
+            return Signal(
+                action='hold',
+                quantity=0,
+                confidence=0.5,
+                reasoning=f"Insufficient data: need {self.long_window} periods, got {len(data)}"
+            )
+        
+        short_ma, long_ma, prev_short_ma, prev_long_ma, data_length = details
+        if action == 'buy':
+            reasoning = f"Golden cross: Short MA {short_ma:.2f} > Long MA {long_ma:.2f}"
+        elif action == 'sell':
+            reasoning = f"Death cross: Short MA {short_ma:.2f} < Long MA {long_ma:.2f}"
+        else:
+            # 持有信号占绝大多数bar，元数据延迟到get_metadata()时再构建
+            return Signal(
+                action='hold',
+                quantity=0,
+                confidence=confidence,
+                reasoning=f"No crossover: Short MA {short_ma:.2f}, Long MA {long_ma:.2f} (data: {data_length} days)",
+                metadata=None,
+                metadata_factory=partial(_build_metadata, *details)
+            )
+        
         return Signal(
-            action='hold',
-            quantity=0,
-            confidence=0.5,
-            reasoning=f"No crossover: Short MA {short_ma:.2f}, Long MA {long_ma:.2f} (data: {len(prices)} days)",
-            metadata={
-                'short_ma': short_ma,
-                'long_ma': long_ma,
-                'prev_short_ma': prev_short_ma,
-                'prev_long_ma': prev_long_ma,
-                'data_length': len(prices)
-            }
-        )
\ No newline at end of file
+            action=action,
+            quantity=quantity,
+            confidence=confidence,
+            reasoning=reasoning,
+            metadata=_build_metadata(*details)
+        )
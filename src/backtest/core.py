@@ -401,6 +401,13 @@ class Backtester:
         trade_history = []
         daily_returns = []
         
+        # 需要完整历史的策略一次性预计算指标
+        if strategy.requires_full_history and len(dates) > 0:
+            full_start = (dates[0] - timedelta(days=required_lookback_days)).strftime("%Y-%m-%d")
+            full_data = self._get_price_data(full_start, dates[-1].strftime("%Y-%m-%d"))
+            if full_data is not None and not full_data.empty:
+                strategy.prepare(full_data)
+        
         for i, current_date in enumerate(dates):
             try:
                 # 动态计算历史数据起始日期
@@ -8,6 +8,25 @@ MAX_MARKDOWN_ROWS = 50  # Markdown输出中显示的最大行数
 MAX_MARKDOWN_COLS = 10  # 显示的最大列数
 
 
+def _format_cell(value) -> str:
+    """将单元格值转换为Markdown安全的字符串（缺失值显示为空）"""
+    if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value):
+        return ""
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def _render_markdown_table(df: pd.DataFrame) -> str:
+    """将DataFrame渲染为Markdown管道表格
+
+    一次性取出二维对象数组并用join拼接，避免逐行迭代DataFrame和tabulate的逐单元格列宽计算
+    """
+    header = "| " + " | ".join(_format_cell(col) for col in df.columns) + " |"
+    separator = "|" + "|".join(["---"] * len(df.columns)) + "|"
+    rows = ("| " + " | ".join(map(_format_cell, row)) + " |"
+            for row in df.to_numpy(dtype=object))
+    return "\n".join([header, separator, *rows])
+
+
 def format_df_to_markdown(df: pd.DataFrame, max_rows: int = MAX_MARKDOWN_ROWS, max_cols: int = MAX_MARKDOWN_COLS) -> str:
     """将Pandas DataFrame格式化为带有截断的Markdown字符串。
 
@@ -49,7 +68,7 @@ def format_df_to_markdown(df: pd.DataFrame, max_rows: int = MAX_MARKDOWN_ROWS, m
         truncated = True
 
     try:
-        markdown_table = df_display.to_markdown(index=False)
+        markdown_table = _render_markdown_table(df_display)
     except Exception as e:
         logger.error(
             f"将DataFrame转换为Markdown时出错: {e}", exc_info=True)
@@ -1,172 +1,204 @@
 import logging
-from typing import Callable, Optional
+import re
+from typing import Callable, NamedTuple, Optional
+
+import pandas as pd
 
 from src.mcp_api.formatting.markdown_formatter import format_df_to_markdown
 from src.mcp_api.data_source_interface import NoDataFoundError, LoginError, DataSourceError
+from src.utils.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# 财务数据查询参数的合法取值
+_YEAR_RE = re.compile(r'[12][0-9]{3}')
+_VALID_QUARTERS = frozenset({1, 2, 3, 4})
+
+# 每个财务报告工具的LRU缓存容量: (code, year, quarter) -> Markdown字符串
+# 已发布的季度财务数据不会变化，热门股票的重复查询可直接复用，无需再次请求数据源和格式化
+FINANCIAL_CACHE_SIZE = 1024
+
+# 预期错误码 -> (日志级别, 返回给调用方的错误信息模板)
+_ERROR_RESPONSES = {
+    'NoDataFoundError': (logging.WARNING, "Error: {}"),
+    'LoginError': (logging.ERROR, "Error: Could not connect to data source. {}"),
+    'DataSourceError': (logging.ERROR, "Error: An error occurred while fetching data. {}"),
+    'ValueError': (logging.WARNING, "Error: Invalid input parameter. {}"),
+}
+
+
+class DataSourceResult(NamedTuple):
+    """数据源调用结果，error_code为None表示成功"""
+    df: Optional[pd.DataFrame]
+    error_code: Optional[str] = None
+    detail: str = ""
+
+
+def _call_data_source(data_source_method: Callable, **kwargs) -> DataSourceResult:
+    """
+    调用数据源方法，并将预期的数据源错误转换为DataSourceResult而不是向上抛出
+
+    意外异常不在此处理，仍由调用方捕获
+    """
+    try:
+        return DataSourceResult(data_source_method(**kwargs))
+    except NoDataFoundError as e:
+        return DataSourceResult(None, 'NoDataFoundError', str(e))
+    except LoginError as e:
+        return DataSourceResult(None, 'LoginError', str(e))
+    except DataSourceError as e:
+        return DataSourceResult(None, 'DataSourceError', str(e))
+    except ValueError as e:
+        return DataSourceResult(None, 'ValueError', str(e))
+
+
+def _format_error(result: DataSourceResult, context: str = "") -> str:
+    """记录失败的数据源调用结果，并生成返回给调用方的错误信息"""
+    level, template = _ERROR_RESPONSES[result.error_code]
+    logger.log(level, "%s%s: %s", result.error_code, context, result.detail)
+    return template.format(result.detail)
+
 
-def call_financial_data_tool(
+def make_financial_tool(
     tool_name: str,
     # Pass the bound method like active_data_source.get_profit_data
     # 传递绑定方法，如 active_data_source.get_profit_data
     data_source_method: Callable,
-    data_type_name: str,
-    code: str,
-    year: str,
-    quarter: int
-) -> str:
+    data_type_name: str
+) -> Callable[[str, str, int], str]:
     """
-    用于减少金融数据工具重复代码的辅助函数
+    为单个金融数据工具生成专用的调用函数
+
+    工具名称和数据类型在注册时即已确定，日志模板在此处一次性生成，
+    每次调用只需按参数惰性格式化日志；成功的查询结果按(code, year, quarter)缓存，
+    缓存归属于生成的函数，不同数据源方法之间互不共享
 
     参数:
         tool_name: 工具名称，用于日志记录
         data_source_method: 要调用的数据源方法
         data_type_name: 金融数据类型（用于日志记录）
-        code: 股票代码
-        year: 查询年份
-        quarter: 查询季度
 
     返回:
-        包含结果或错误信息的Markdown格式字符串
+        签名为(code, year, quarter)的函数，返回包含结果或错误信息的Markdown格式字符串
     """
-    logger.info(f"Tool '{tool_name}' called for {code}, {year}Q{quarter}")
-    try:
-        # 基本验证
-        if not year.isdigit() or len(year) != 4:
-            logger.warning(f"Invalid year format requested: {year}")
-            return f"Error: Invalid year '{year}'. Please provide a 4-digit year."
-        if not 1 <= quarter <= 4:
-            logger.warning(f"Invalid quarter requested: {quarter}")
-            return f"Error: Invalid quarter '{quarter}'. Must be between 1 and 4."
-
-        # 调用已实例化的active_data_source上的适当方法
-        df = data_source_method(code=code, year=year, quarter=quarter)
-        logger.info(
-            f"Successfully retrieved {data_type_name} data for {code}, {year}Q{quarter}.")
-        # 对金融表格使用较小的限制?
-        return format_df_to_markdown(df, max_rows=20, max_cols=10)
-
-    except NoDataFoundError as e:
-        # 未找到数据错误
-        logger.warning(f"NoDataFoundError for {code}, {year}Q{quarter}: {e}")
-        return f"Error: {e}"
-    except LoginError as e:
-        # 登录错误
-        logger.error(f"LoginError for {code}: {e}")
-        return f"Error: Could not connect to data source. {e}"
-    except DataSourceError as e:
-        # 数据源错误
-        logger.error(f"DataSourceError for {code}: {e}")
-        return f"Error: An error occurred while fetching data. {e}"
-    except ValueError as e:
-        # 值错误
-        logger.warning(f"ValueError processing request for {code}: {e}")
-        return f"Error: Invalid input parameter. {e}"
-    except Exception as e:
-        # 意外异常
-        logger.exception(
-            f"Unexpected Exception processing {tool_name} for {code}: {e}")
-        return f"Error: An unexpected error occurred: {e}"
-
-
-def call_macro_data_tool(
+    called_msg = f"Tool '{tool_name}' called for %s, %sQ%s"
+    success_msg = f"Successfully retrieved {data_type_name} data for %s, %sQ%s."
+    cache_hit_msg = f"Serving cached {data_type_name} data for %s, %sQ%s."
+    unexpected_msg = f"Unexpected Exception processing {tool_name} for %s: %s"
+    cache = LRUCache(maxsize=FINANCIAL_CACHE_SIZE)
+
+    def financial_tool(code: str, year: str, quarter: int) -> str:
+        logger.info(called_msg, code, year, quarter)
+        try:
+            # 基本验证
+            if _YEAR_RE.fullmatch(year) is None:
+                logger.warning("Invalid year format requested: %s", year)
+                return f"Error: Invalid year '{year}'. Please provide a 4-digit year."
+            if quarter not in _VALID_QUARTERS:
+                logger.warning("Invalid quarter requested: %s", quarter)
+                return f"Error: Invalid quarter '{quarter}'. Must be between 1 and 4."
+
+            cache_key = (code, year, quarter)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(cache_hit_msg, code, year, quarter)
+                return cached
+
+            # 调用已实例化的active_data_source上的适当方法
+            result = _call_data_source(data_source_method, code=code, year=year, quarter=quarter)
+            if result.error_code:
+                return _format_error(result, f" for {code}, {year}Q{quarter}")
+            logger.info(success_msg, code, year, quarter)
+            # 对金融表格使用较小的限制?
+            markdown = format_df_to_markdown(result.df, max_rows=20, max_cols=10)
+            # 仅缓存非空的成功结果，错误或空数据（如尚未发布）下次仍会重新查询
+            if not result.df.empty:
+                cache.put(cache_key, markdown)
+            return markdown
+
+        except Exception as e:
+            # 意外异常
+            logger.exception(unexpected_msg, code, e)
+            return f"Error: An unexpected error occurred: {e}"
+
+    financial_tool.__name__ = tool_name
+    return financial_tool
+
+
+def make_macro_tool(
     tool_name: str,
     data_source_method: Callable,
-    data_type_name: str,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    **kwargs  # 用于额外参数，如year_type
-) -> str:
+    data_type_name: str
+) -> Callable[..., str]:
     """
-    用于宏观经济数据工具的辅助函数
+    为单个宏观经济数据工具生成专用的调用函数
 
     参数:
         tool_name: 工具名称，用于日志记录
         data_source_method: 要调用的数据源方法
         data_type_name: 数据类型（用于日志记录）
-        start_date: 可选的开始日期
-        end_date: 可选的结束日期
-        **kwargs: 传递给data_source_method的额外关键字参数
 
     返回:
-        包含结果或错误信息的Markdown格式字符串
+        签名为(start_date, end_date, **kwargs)的函数，kwargs为传递给data_source_method的
+        额外关键字参数（如yearType），返回包含结果或错误信息的Markdown格式字符串
     """
-    date_range_log = f"from {start_date or 'default'} to {end_date or 'default'}"
-    kwargs_log = f", extra_args={kwargs}" if kwargs else ""
-    logger.info(f"Tool '{tool_name}' called {date_range_log}{kwargs_log}")
-    try:
-        # 调用active_data_source上的适当方法
-        df = data_source_method(start_date=start_date,
-                                end_date=end_date, **kwargs)
-        logger.info(f"Successfully retrieved {data_type_name} data.")
-        return format_df_to_markdown(df)
-    except NoDataFoundError as e:
-        # 未找到数据错误
-        logger.warning(f"NoDataFoundError: {e}")
-        return f"Error: {e}"
-    except LoginError as e:
-        # 登录错误
-        logger.error(f"LoginError: {e}")
-        return f"Error: Could not connect to data source. {e}"
-    except DataSourceError as e:
-        # 数据源错误
-        logger.error(f"DataSourceError: {e}")
-        return f"Error: An error occurred while fetching data. {e}"
-    except ValueError as e:
-        # 值错误
-        logger.warning(f"ValueError: {e}")
-        return f"Error: Invalid input parameter. {e}"
-    except Exception as e:
-        # 意外异常
-        logger.exception(f"Unexpected Exception processing {tool_name}: {e}")
-        return f"Error: An unexpected error occurred: {e}"
-
-
-def call_index_constituent_tool(
+    called_msg = f"Tool '{tool_name}' called from %s to %s%s"
+    success_msg = f"Successfully retrieved {data_type_name} data."
+    unexpected_msg = f"Unexpected Exception processing {tool_name}: %s"
+
+    def macro_tool(start_date: Optional[str] = None, end_date: Optional[str] = None, **kwargs) -> str:
+        logger.info(called_msg, start_date or 'default', end_date or 'default',
+                    f", extra_args={kwargs}" if kwargs else "")
+        try:
+            # 调用active_data_source上的适当方法
+            result = _call_data_source(data_source_method, start_date=start_date,
+                                       end_date=end_date, **kwargs)
+            if result.error_code:
+                return _format_error(result)
+            logger.info(success_msg)
+            return format_df_to_markdown(result.df)
+        except Exception as e:
+            # 意外异常
+            logger.exception(unexpected_msg, e)
+            return f"Error: An unexpected error occurred: {e}"
+
+    macro_tool.__name__ = tool_name
+    return macro_tool
+
+
+def make_index_constituent_tool(
     tool_name: str,
     data_source_method: Callable,
-    index_name: str,
-    date: Optional[str] = None
-) -> str:
+    index_name: str
+) -> Callable[[Optional[str]], str]:
     """
-    用于指数成分股工具的辅助函数
+    为单个指数成分股工具生成专用的调用函数
 
     参数:
         tool_name: 工具名称，用于日志记录
         data_source_method: 要调用的数据源方法
         index_name: 指数名称（用于日志记录）
-        date: 可选的查询日期
 
     返回:
-        包含结果或错误信息的Markdown格式字符串
+        签名为(date)的函数，返回包含结果或错误信息的Markdown格式字符串
     """
-    log_msg = f"Tool '{tool_name}' called for date={date or 'latest'}"
-    logger.info(log_msg)
-    try:
-        # 如果需要，添加日期验证
-        df = data_source_method(date=date)
-        logger.info(
-            f"Successfully retrieved {index_name} constituents for {date or 'latest'}.")
-        return format_df_to_markdown(df)
-    except NoDataFoundError as e:
-        # 未找到数据错误
-        logger.warning(f"NoDataFoundError: {e}")
-        return f"Error: {e}"
-    except LoginError as e:
-        # 登录错误
-        logger.error(f"LoginError: {e}")
-        return f"Error: Could not connect to data source. {e}"
-    except DataSourceError as e:
-        # 数据源错误
-        logger.error(f"DataSourceError: {e}")
-        return f"Error: An error occurred while fetching data. {e}"
-    except ValueError as e:
-        # 值错误
-        logger.warning(f"ValueError: {e}")
-        return f"Error: Invalid input parameter. {e}"
-    except Exception as e:
-        # 意外异常
-        logger.exception(f"Unexpected Exception processing {tool_name}: {e}")
-        return f"Error: An unexpected error occurred: {e}"
\ No newline at end of file
+    called_msg = f"Tool '{tool_name}' called for date=%s"
+    success_msg = f"Successfully retrieved {index_name} constituents for %s."
+    unexpected_msg = f"Unexpected Exception processing {tool_name}: %s"
+
+    def index_constituent_tool(date: Optional[str] = None) -> str:
+        logger.info(called_msg, date or 'latest')
+        try:
+            # 如果需要，添加日期验证
+            result = _call_data_source(data_source_method, date=date)
+            if result.error_code:
+                return _format_error(result)
+            logger.info(success_msg, date or 'latest')
+            return format_df_to_markdown(result.df)
+        except Exception as e:
+            # 意外异常
+            logger.exception(unexpected_msg, e)
+            return f"Error: An unexpected error occurred: {e}"
+
+    index_constituent_tool.__name__ = tool_name
+    return index_constituent_tool
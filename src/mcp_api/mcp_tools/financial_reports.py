@@ -2,7 +2,7 @@ import logging
 
 from mcp.server.fastmcp import FastMCP
 from src.mcp_api.data_source_interface import FinancialDataSource
-from src.mcp_api.mcp_tools.base import call_financial_data_tool
+from src.mcp_api.mcp_tools.base import make_financial_tool
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +16,9 @@ def register_financial_report_tools(app: FastMCP, active_data_source: FinancialD
         active_data_source: 活跃的金融数据源
     """
 
+    fetch_profit_data = make_financial_tool(
+        "get_profit_data", active_data_source.get_profit_data, "Profitability")
+
     @app.tool()
     def get_profit_data(code: str, year: str, quarter: int) -> str:
         """
@@ -29,12 +32,10 @@ def register_financial_report_tools(app: FastMCP, active_data_source: FinancialD
         返回:
             包含盈利能力数据的Markdown表格或错误信息
         """
-        return call_financial_data_tool(
-            "get_profit_data",
-            active_data_source.get_profit_data,
-            "Profitability",
-            code, year, quarter
-        )
+        return fetch_profit_data(code, year, quarter)
+
+    fetch_operation_data = make_financial_tool(
+        "get_operation_data", active_data_source.get_operation_data, "Operation Capability")
 
     @app.tool()
     def get_operation_data(code: str, year: str, quarter: int) -> str:
@@ -49,12 +50,10 @@ def register_financial_report_tools(app: FastMCP, active_data_source: FinancialD
         返回:
             包含运营能力数据的Markdown表格或错误信息
         """
-        return call_financial_data_tool(
-            "get_operation_data",
-            active_data_source.get_operation_data,
-            "Operation Capability",
-            code, year, quarter
-        )
+        return fetch_operation_data(code, year, quarter)
+
+    fetch_growth_data = make_financial_tool(
+        "get_growth_data", active_data_source.get_growth_data, "Growth Capability")
 
     @app.tool()
     def get_growth_data(code: str, year: str, quarter: int) -> str:
@@ -69,12 +68,10 @@ def register_financial_report_tools(app: FastMCP, active_data_source: FinancialD
         返回:
             包含增长能力数据的Markdown表格或错误信息
         """
-        return call_financial_data_tool(
-            "get_growth_data",
-            active_data_source.get_growth_data,
-            "Growth Capability",
-            code, year, quarter
-        )
+        return fetch_growth_data(code, year, quarter)
+
+    fetch_balance_data = make_financial_tool(
+        "get_balance_data", active_data_source.get_balance_data, "Balance Sheet")
 
     @app.tool()
     def get_balance_data(code: str, year: str, quarter: int) -> str:
@@ -89,12 +86,10 @@ def register_financial_report_tools(app: FastMCP, active_data_source: FinancialD
         返回:
             包含资产负债表数据的Markdown表格或错误信息
         """
-        return call_financial_data_tool(
-            "get_balance_data",
-            active_data_source.get_balance_data,
-            "Balance Sheet",
-            code, year, quarter
-        )
+        return fetch_balance_data(code, year, quarter)
+
+    fetch_cash_flow_data = make_financial_tool(
+        "get_cash_flow_data", active_data_source.get_cash_flow_data, "Cash Flow")
 
     @app.tool()
     def get_cash_flow_data(code: str, year: str, quarter: int) -> str:
@@ -109,12 +104,10 @@ def register_financial_report_tools(app: FastMCP, active_data_source: FinancialD
         返回:
             包含现金流量数据的Markdown表格或错误信息
         """
-        return call_financial_data_tool(
-            "get_cash_flow_data",
-            active_data_source.get_cash_flow_data,
-            "Cash Flow",
-            code, year, quarter
-        )
+        return fetch_cash_flow_data(code, year, quarter)
+
+    fetch_dupont_data = make_financial_tool(
+        "get_dupont_data", active_data_source.get_dupont_data, "DuPont Analysis")
 
     @app.tool()
     def get_dupont_data(code: str, year: str, quarter: int) -> str:
@@ -129,12 +122,7 @@ def register_financial_report_tools(app: FastMCP, active_data_source: FinancialD
         返回:
             包含杜邦分析数据的Markdown表格或错误信息
         """
-        return call_financial_data_tool(
-            "get_dupont_data",
-            active_data_source.get_dupont_data,
-            "DuPont Analysis",
-            code, year, quarter
-        )
+        return fetch_dupont_data(code, year, quarter)
 
     @app.tool()
     def get_performance_express_report(code: str, start_date: str, end_date: str) -> str:
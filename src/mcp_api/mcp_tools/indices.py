@@ -3,7 +3,7 @@ from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 from src.mcp_api.data_source_interface import FinancialDataSource
-from src.mcp_api.mcp_tools.base import call_index_constituent_tool
+from src.mcp_api.mcp_tools.base import make_index_constituent_tool
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +44,9 @@ def register_index_tools(app: FastMCP, active_data_source: FinancialDataSource):
                 f"Exception processing get_stock_industry: {e}")
             return f"Error: An unexpected error occurred: {e}"
 
+    fetch_sz50_stocks = make_index_constituent_tool(
+        "get_sz50_stocks", active_data_source.get_sz50_stocks, "SZSE 50")
+
     @app.tool()
     def get_sz50_stocks(date: Optional[str] = None) -> str:
         """
@@ -55,12 +58,10 @@ def register_index_tools(app: FastMCP, active_data_source: FinancialDataSource):
         返回:
             包含上证50指数成分股的Markdown表格或错误信息
         """
-        return call_index_constituent_tool(
-            "get_sz50_stocks",
-            active_data_source.get_sz50_stocks,
-            "SZSE 50",
-            date
-        )
+        return fetch_sz50_stocks(date)
+
+    fetch_hs300_stocks = make_index_constituent_tool(
+        "get_hs300_stocks", active_data_source.get_hs300_stocks, "CSI 300")
 
     @app.tool()
     def get_hs300_stocks(date: Optional[str] = None) -> str:
@@ -73,12 +74,10 @@ def register_index_tools(app: FastMCP, active_data_source: FinancialDataSource):
         返回:
             包含沪深300指数成分股的Markdown表格或错误信息
         """
-        return call_index_constituent_tool(
-            "get_hs300_stocks",
-            active_data_source.get_hs300_stocks,
-            "CSI 300",
-            date
-        )
+        return fetch_hs300_stocks(date)
+
+    fetch_zz500_stocks = make_index_constituent_tool(
+        "get_zz500_stocks", active_data_source.get_zz500_stocks, "CSI 500")
 
     @app.tool()
     def get_zz500_stocks(date: Optional[str] = None) -> str:
@@ -91,9 +90,4 @@ def register_index_tools(app: FastMCP, active_data_source: FinancialDataSource):
         返回:
             包含中证500指数成分股的Markdown表格或错误信息
         """
-        return call_index_constituent_tool(
-            "get_zz500_stocks",
-            active_data_source.get_zz500_stocks,
-            "CSI 500",
-            date
-        )
\ No newline at end of file
+        return fetch_zz500_stocks(date)
\ No newline at end of file
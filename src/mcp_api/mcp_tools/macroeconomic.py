@@ -3,7 +3,7 @@ from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 from src.mcp_api.data_source_interface import FinancialDataSource
-from src.mcp_api.mcp_tools.base import call_macro_data_tool
+from src.mcp_api.mcp_tools.base import make_macro_tool
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,9 @@ def register_macroeconomic_tools(app: FastMCP, active_data_source: FinancialData
         active_data_source: 活跃的金融数据源
     """
 
+    fetch_deposit_rate_data = make_macro_tool(
+        "get_deposit_rate_data", active_data_source.get_deposit_rate_data, "Deposit Rate")
+
     @app.tool()
     def get_deposit_rate_data(start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
         """
@@ -29,12 +32,10 @@ def register_macroeconomic_tools(app: FastMCP, active_data_source: FinancialData
         返回:
             包含存款利率数据的Markdown表格或错误信息
         """
-        return call_macro_data_tool(
-            "get_deposit_rate_data",
-            active_data_source.get_deposit_rate_data,
-            "Deposit Rate",
-            start_date, end_date
-        )
+        return fetch_deposit_rate_data(start_date, end_date)
+
+    fetch_loan_rate_data = make_macro_tool(
+        "get_loan_rate_data", active_data_source.get_loan_rate_data, "Loan Rate")
 
     @app.tool()
     def get_loan_rate_data(start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
@@ -48,12 +49,10 @@ def register_macroeconomic_tools(app: FastMCP, active_data_source: FinancialData
         返回:
             包含贷款利率数据的Markdown表格或错误信息
         """
-        return call_macro_data_tool(
-            "get_loan_rate_data",
-            active_data_source.get_loan_rate_data,
-            "Loan Rate",
-            start_date, end_date
-        )
+        return fetch_loan_rate_data(start_date, end_date)
+
+    fetch_required_reserve_ratio_data = make_macro_tool(
+        "get_required_reserve_ratio_data", active_data_source.get_required_reserve_ratio_data, "Required Reserve Ratio")
 
     @app.tool()
     def get_required_reserve_ratio_data(start_date: Optional[str] = None, end_date: Optional[str] = None, year_type: str = '0') -> str:
@@ -73,13 +72,11 @@ def register_macroeconomic_tools(app: FastMCP, active_data_source: FinancialData
             logger.warning(f"Invalid year_type requested: {year_type}")
             return "Error: Invalid year_type '{year_type}'. Valid options are '0' (announcement date) or '1' (effective date)."
 
-        return call_macro_data_tool(
-            "get_required_reserve_ratio_data",
-            active_data_source.get_required_reserve_ratio_data,
-            "Required Reserve Ratio",
-            start_date, end_date,
-            yearType=year_type  # 正确命名传递额外参数给Baostock
-        )
+        # 正确命名传递额外参数给Baostock
+        return fetch_required_reserve_ratio_data(start_date, end_date, yearType=year_type)
+
+    fetch_money_supply_data_month = make_macro_tool(
+        "get_money_supply_data_month", active_data_source.get_money_supply_data_month, "Monthly Money Supply")
 
     @app.tool()
     def get_money_supply_data_month(start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
@@ -94,12 +91,10 @@ def register_macroeconomic_tools(app: FastMCP, active_data_source: FinancialData
             包含月度货币供应量数据的Markdown表格或错误信息
         """
         # 如果需要，可以添加对YYYY-MM格式的特定验证
-        return call_macro_data_tool(
-            "get_money_supply_data_month",
-            active_data_source.get_money_supply_data_month,
-            "Monthly Money Supply",
-            start_date, end_date
-        )
+        return fetch_money_supply_data_month(start_date, end_date)
+
+    fetch_money_supply_data_year = make_macro_tool(
+        "get_money_supply_data_year", active_data_source.get_money_supply_data_year, "Yearly Money Supply")
 
     @app.tool()
     def get_money_supply_data_year(start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
@@ -114,12 +109,7 @@ def register_macroeconomic_tools(app: FastMCP, active_data_source: FinancialData
             包含年度货币供应量数据的Markdown表格或错误信息
         """
         # 如果需要，可以添加对YYYY格式的特定验证
-        return call_macro_data_tool(
-            "get_money_supply_data_year",
-            active_data_source.get_money_supply_data_year,
-            "Yearly Money Supply",
-            start_date, end_date
-        )
+        return fetch_money_supply_data_year(start_date, end_date)
 
     @app.tool()
     def get_shibor_data(start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
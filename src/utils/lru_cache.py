@@ -0,0 +1,29 @@
+"""
+LRU缓存工具 - 线程安全的有界缓存，供agent与MCP工具复用计算结果
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """线程安全的有界LRU缓存"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+辩论室辅助函数测试
+固定置信度解析与数值信号标签映射的边界行为
+"""
+
+import sys
+import os
+import unittest
+
+import numpy as np
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.debate_room import _to_float_confidence, _signal_to_label
+
+
+class TestToFloatConfidence(unittest.TestCase):
+    """置信度解析测试"""
+
+    def test_fraction_values_pass_through(self):
+        """[0, 1]区间内的数值与数值字符串原样保留"""
+        self.assertEqual(_to_float_confidence(0.7), 0.7)
+        self.assertEqual(_to_float_confidence("0.7"), 0.7)
+        self.assertEqual(_to_float_confidence(1), 1.0)
+        self.assertEqual(_to_float_confidence(0), 0.0)
+
+    def test_percent_values(self):
+        """百分数字符串与大于1的数值按百分数解析"""
+        self.assertAlmostEqual(_to_float_confidence("70%"), 0.7)
+        self.assertAlmostEqual(_to_float_confidence(" 70% "), 0.7)
+        self.assertAlmostEqual(_to_float_confidence("70"), 0.7)
+        self.assertAlmostEqual(_to_float_confidence(70), 0.7)
+
+    def test_clamped_to_unit_interval(self):
+        """超出范围的置信度截断到[0, 1]"""
+        self.assertEqual(_to_float_confidence(150), 1.0)
+        self.assertEqual(_to_float_confidence("150%"), 1.0)
+        self.assertEqual(_to_float_confidence(-0.2), 0.0)
+        self.assertEqual(_to_float_confidence("-5%"), 0.0)
+
+    def test_unparsable_values_default_to_half(self):
+        """无法解析的置信度返回0.5"""
+        self.assertEqual(_to_float_confidence("high"), 0.5)
+        self.assertEqual(_to_float_confidence(None), 0.5)
+        self.assertEqual(_to_float_confidence({}), 0.5)
+
+
+class TestSignalToLabel(unittest.TestCase):
+    """数值信号到字符串信号的映射测试"""
+
+    def test_thresholds_are_neutral(self):
+        """±0.1本身归为neutral"""
+        self.assertEqual(_signal_to_label(0.1), 'neutral')
+        self.assertEqual(_signal_to_label(-0.1), 'neutral')
+        self.assertEqual(_signal_to_label(0.0), 'neutral')
+
+    def test_values_beyond_thresholds(self):
+        """超过±0.1的信号分别映射为bullish/bearish"""
+        self.assertEqual(_signal_to_label(np.nextafter(0.1, np.inf)), 'bullish')
+        self.assertEqual(_signal_to_label(0.1000001), 'bullish')
+        self.assertEqual(_signal_to_label(np.nextafter(-0.1, -np.inf)), 'bearish')
+        self.assertEqual(_signal_to_label(-0.1000001), 'bearish')
+
+    def test_nan_is_neutral(self):
+        """NaN信号视为neutral"""
+        self.assertEqual(_signal_to_label(float('nan')), 'neutral')
+
+    def test_array_input(self):
+        """数组输入逐元素映射"""
+        labels = _signal_to_label(np.array([-0.5, -0.1, 0.1, 0.5]))
+        self.assertEqual(list(labels), ['bearish', 'neutral', 'neutral', 'bullish'])
+
+
+if __name__ == '__main__':
+    unittest.main()
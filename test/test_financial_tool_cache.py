@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+财务报告工具缓存测试
+验证make_financial_tool生成的函数按(code, year, quarter)缓存成功结果，
+错误与空数据不缓存，且不同数据源方法的缓存互不共享
+"""
+
+import sys
+import os
+import unittest
+
+import pandas as pd
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_api.data_source_interface import NoDataFoundError
+from src.mcp_api.mcp_tools.base import make_financial_tool
+
+
+class _FakeDataSourceMethod:
+    """记录调用次数的数据源方法替身"""
+
+    def __init__(self, df: pd.DataFrame = None, error: Exception = None):
+        self.df = df
+        self.error = error
+        self.calls = []
+
+    def __call__(self, code: str, year: str, quarter: int) -> pd.DataFrame:
+        self.calls.append((code, year, quarter))
+        if self.error is not None:
+            raise self.error
+        return self.df
+
+
+def _make_report(value: float) -> pd.DataFrame:
+    return pd.DataFrame({'code': ['sh.600000'], 'roeAvg': [value]})
+
+
+class TestFinancialToolCache(unittest.TestCase):
+    """财务报告工具缓存测试"""
+
+    def test_repeated_query_hits_cache(self):
+        """相同参数的第二次查询直接返回缓存结果，不再请求数据源"""
+        method = _FakeDataSourceMethod(df=_make_report(0.12))
+        tool = make_financial_tool("get_profit_data", method, "Profitability")
+
+        first = tool("sh.600000", "2023", 4)
+        second = tool("sh.600000", "2023", 4)
+
+        self.assertEqual(first, second)
+        self.assertIn("0.12", first)
+        self.assertEqual(len(method.calls), 1)
+
+    def test_different_query_misses_cache(self):
+        """参数不同的查询需要重新请求数据源"""
+        method = _FakeDataSourceMethod(df=_make_report(0.12))
+        tool = make_financial_tool("get_profit_data", method, "Profitability")
+
+        tool("sh.600000", "2023", 4)
+        tool("sh.600000", "2023", 3)
+        tool("sh.600000", "2022", 4)
+
+        self.assertEqual(len(method.calls), 3)
+
+    def test_errors_are_not_cached(self):
+        """数据源报错时不缓存，下次查询仍会请求数据源"""
+        method = _FakeDataSourceMethod(error=NoDataFoundError("not published"))
+        tool = make_financial_tool("get_profit_data", method, "Profitability")
+
+        first = tool("sh.600000", "2024", 4)
+        tool("sh.600000", "2024", 4)
+
+        self.assertTrue(first.startswith("Error:"))
+        self.assertEqual(len(method.calls), 2)
+
+    def test_empty_results_are_not_cached(self):
+        """空数据（如尚未发布）不缓存"""
+        method = _FakeDataSourceMethod(df=pd.DataFrame())
+        tool = make_financial_tool("get_profit_data", method, "Profitability")
+
+        tool("sh.600000", "2024", 4)
+        tool("sh.600000", "2024", 4)
+
+        self.assertEqual(len(method.calls), 2)
+
+    def test_tools_do_not_share_cache(self):
+        """同名工具绑定不同数据源方法时各自缓存，不会返回其他数据源的结果"""
+        first_source = _FakeDataSourceMethod(df=_make_report(0.12))
+        second_source = _FakeDataSourceMethod(df=_make_report(0.34))
+        first_tool = make_financial_tool("get_profit_data", first_source, "Profitability")
+        second_tool = make_financial_tool("get_profit_data", second_source, "Profitability")
+
+        first = first_tool("sh.600000", "2023", 4)
+        second = second_tool("sh.600000", "2023", 4)
+
+        self.assertIn("0.12", first)
+        self.assertIn("0.34", second)
+        self.assertEqual(len(first_source.calls), 1)
+        self.assertEqual(len(second_source.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
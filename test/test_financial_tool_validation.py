@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+财务报告工具参数校验测试
+固定年份与季度的合法取值范围：年份为1000-2999的4位ASCII数字，季度为1-4的整数
+"""
+
+import sys
+import os
+import unittest
+
+import pandas as pd
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_api.mcp_tools.base import make_financial_tool
+
+
+class _FakeDataSourceMethod:
+    """记录调用参数的数据源方法替身"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, code: str, year: str, quarter: int) -> pd.DataFrame:
+        self.calls.append((code, year, quarter))
+        return pd.DataFrame({'code': [code], 'statDate': [f"{year}Q{quarter}"]})
+
+
+class TestFinancialToolValidation(unittest.TestCase):
+    """年份与季度参数校验测试"""
+
+    def setUp(self):
+        self.method = _FakeDataSourceMethod()
+        self.tool = make_financial_tool("get_profit_data", self.method, "Profitability")
+
+    def test_valid_years_are_accepted(self):
+        """1000-2999范围内的年份通过校验"""
+        for year in ("1000", "2023", "2999"):
+            with self.subTest(year=year):
+                self.assertFalse(self.tool("sh.600000", year, 4).startswith("Error:"))
+        self.assertEqual([call[1] for call in self.method.calls], ["1000", "2023", "2999"])
+
+    def test_invalid_years_are_rejected(self):
+        """超出范围、位数不对、带换行或非ASCII数字的年份被拒绝，且不请求数据源"""
+        for year in ("0999", "3000", "999", "20234", "2023\n", "２０２３", "abcd"):
+            with self.subTest(year=year):
+                result = self.tool("sh.600000", year, 4)
+                self.assertTrue(result.startswith("Error: Invalid year"))
+        self.assertEqual(self.method.calls, [])
+
+    def test_invalid_quarters_are_rejected(self):
+        """季度不在1-4内或不是整数时被拒绝，且不请求数据源"""
+        for quarter in (0, 5, -1, 1.5, "1"):
+            with self.subTest(quarter=quarter):
+                result = self.tool("sh.600000", "2023", quarter)
+                self.assertTrue(result.startswith("Error: Invalid quarter"))
+        self.assertEqual(self.method.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
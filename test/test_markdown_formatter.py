@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Markdown表格格式化测试
+固定join渲染器对特殊字符、缺失值和数值的输出
+"""
+
+import sys
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_api.formatting.markdown_formatter import format_df_to_markdown
+
+
+def _table_rows(markdown: str) -> list:
+    """返回表格的数据行（跳过表头与分隔行）"""
+    return markdown.splitlines()[2:]
+
+
+class TestFormatDfToMarkdown(unittest.TestCase):
+    """Markdown表格格式化测试"""
+
+    def test_table_layout(self):
+        """表头、分隔行与数据行的格式"""
+        df = pd.DataFrame({'code': ['sh.600000'], 'name': ['浦发银行']})
+        self.assertEqual(
+            format_df_to_markdown(df),
+            "| code | name |\n|---|---|\n| sh.600000 | 浦发银行 |"
+        )
+
+    def test_pipes_and_newlines_are_escaped(self):
+        """单元格与列名中的管道符被转义，换行被替换为空格，不会破坏表格结构"""
+        df = pd.DataFrame({'a|b': ['x|y'], 'note': ['line1\nline2']})
+        markdown = format_df_to_markdown(df)
+        self.assertEqual(markdown.splitlines()[0], "| a\\|b | note |")
+        self.assertEqual(_table_rows(markdown), ["| x\\|y | line1 line2 |"])
+
+    def test_missing_values_are_blank(self):
+        """NaN、None、NaT与pd.NA显示为空单元格"""
+        df = pd.DataFrame({
+            'float': [np.nan],
+            'object': [None],
+            'date': [pd.NaT],
+            'nullable': pd.array([pd.NA], dtype='Int64'),
+        })
+        self.assertEqual(_table_rows(format_df_to_markdown(df)), ["|  |  |  |  |"])
+
+    def test_values_are_not_reformatted(self):
+        """数值按原值输出，不做tabulate式的浮点数舍入，数字字符串保留前导零"""
+        df = pd.DataFrame({'roe': [0.123456789], 'code': ['000001'], 'volume': [1234567]})
+        self.assertEqual(_table_rows(format_df_to_markdown(df)), ["| 0.123456789 | 000001 | 1234567 |"])
+
+    def test_empty_dataframe(self):
+        """空DataFrame返回提示信息"""
+        self.assertEqual(format_df_to_markdown(pd.DataFrame()), "(没有可显示的数据)")
+
+
+if __name__ == '__main__':
+    unittest.main()
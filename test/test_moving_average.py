@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+移动平均策略预计算测试
+使用与回测引擎一致的数据形态（RangeIndex + date列）验证预计算路径
+"""
+
+import sys
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.backtest.baselines.base_strategy import Portfolio
+from src.backtest.baselines.moving_average import MovingAverageStrategy
+
+
+def _make_price_frame(n_days: int = 520, seed: int = 42) -> pd.DataFrame:
+    """生成与get_price_data返回形态一致的价格数据：RangeIndex，日期在date列"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+    return pd.DataFrame({
+        'date': pd.bdate_range('2022-01-03', periods=n_days),
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': rng.integers(100000, 1000000, n_days)
+    })
+
+
+def _get_window(full_data: pd.DataFrame, end: int, lookback: int) -> pd.DataFrame:
+    """模拟回测引擎逐bar获取的数据窗口：每次都是重新编号的新DataFrame"""
+    return full_data.iloc[max(0, end - lookback):end + 1].reset_index(drop=True)
+
+
+class TestMovingAveragePrecompute(unittest.TestCase):
+    """移动平均策略预计算路径测试"""
+
+    def setUp(self):
+        self.full_data = _make_price_frame()
+        self.short_window = 20
+        self.long_window = 60
+        self.lookback = 90
+
+    def _run(self, strategy: MovingAverageStrategy) -> list:
+        """按回测引擎的方式逐bar生成信号，并按信号更新持仓"""
+        portfolio = Portfolio(cash=100000, stock=0, total_value=100000)
+        signals = []
+        for end in range(self.lookback, len(self.full_data)):
+            data = _get_window(self.full_data, end, self.lookback)
+            signal = strategy.generate_signal(data, portfolio, str(data['date'].iat[-1].date()))
+            price = data['close'].iat[-1]
+            if signal.action == 'buy':
+                portfolio.stock += signal.quantity
+                portfolio.cash -= signal.quantity * price
+            elif signal.action == 'sell':
+                portfolio.stock -= signal.quantity
+                portfolio.cash += signal.quantity * price
+            signals.append(signal)
+        return signals
+
+    def test_precompute_hits_with_date_column(self):
+        """RangeIndex数据应通过date列命中预计算结果"""
+        strategy = MovingAverageStrategy(self.short_window, self.long_window)
+        strategy.prepare(self.full_data)
+
+        n_bars = len(self.full_data) - self.lookback
+        hits = 0
+        for end in range(self.lookback, len(self.full_data)):
+            data = _get_window(self.full_data, end, self.lookback)
+            prices = data['close'].to_numpy(dtype=np.float64)
+            hits += strategy._lookup_precomputed(data, prices) is not None
+        self.assertEqual(hits, n_bars)
+
+    def test_precompute_matches_per_bar_signals(self):
+        """预计算路径与逐bar计算路径生成的信号一致"""
+        precomputed = MovingAverageStrategy(self.short_window, self.long_window)
+        precomputed.prepare(self.full_data)
+        per_bar = MovingAverageStrategy(self.short_window, self.long_window)
+
+        expected = self._run(per_bar)
+        actual = self._run(precomputed)
+
+        self.assertTrue(any(signal.action != 'hold' for signal in expected))
+        for got, want in zip(actual, expected):
+            self.assertEqual(
+                (got.action, got.quantity, got.confidence, got.reasoning),
+                (want.action, want.quantity, want.confidence, want.reasoning)
+            )
+
+    def test_adjusted_price_mismatch_falls_back(self):
+        """窗口价格与预计算价格不一致（如复权差异）时回退到逐bar计算"""
+        strategy = MovingAverageStrategy(self.short_window, self.long_window)
+        strategy.prepare(self.full_data)
+
+        data = _get_window(self.full_data, len(self.full_data) - 1, self.lookback)
+        data['close'] = data['close'] * 1.0001
+        prices = data['close'].to_numpy(dtype=np.float64)
+        self.assertIsNone(strategy._lookup_precomputed(data, prices))
+
+
+if __name__ == '__main__':
+    unittest.main()